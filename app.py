@@ -1,6 +1,5 @@
 import streamlit as st
 from src.data import load_data, load_geojson
-from src.ui import render_dashboard, render_map, render_analysis, render_documentation
 
 st.set_page_config(
     page_title="India Iceberg Index",
@@ -34,22 +33,32 @@ def main():
         "*Personal Project and Opinions.*"
     )
 
-    # Load Data
-    with st.spinner("Loading data..."):
-        try:
-            df, summary_stats = load_data()
-            geojson = load_geojson()
-        except Exception as e:
-            st.error(f"Error loading data: {e}")
-            return
+    # Load Data (cached across reruns; load_data shows its own spinner)
+    try:
+        df, summary_stats = load_data()
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return
 
+    # Page renderers are imported on demand so a cold start only loads the
+    # plotting stack needed by the page being viewed.
     if page == "Dashboard":
+        from src.ui import render_dashboard
         render_dashboard(df, summary_stats)
     elif page == "Geographic Analysis":
-        render_map(df, geojson)
+        from src.ui import render_map
+        # Only the map needs the district boundaries, the slowest file to load
+        try:
+            geojson, geojson_version = load_geojson()
+        except Exception as e:
+            st.error(f"Error loading map data: {e}")
+            return
+        render_map(df, geojson, geojson_version)
     elif page == "Socio Economic Analysis":
+        from src.ui import render_analysis
         render_analysis(df)
     elif page == "Methodology":
+        from src.ui import render_documentation
         render_documentation()
 
 if __name__ == "__main__":
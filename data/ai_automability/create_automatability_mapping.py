@@ -1013,6 +1013,17 @@ def get_automatability_score(onet_code, score_map, felten_df):
     # Strategy 6: Return median if no match
     return felten_df['LM_AIOE'].median(), 'median'
 
+def load_crosswalk(path):
+    """
+    Load the NCO-ONET crosswalk written by nco_onet_crosswalk.py.
+    
+    Reads Parquet when the path ends in .parquet, otherwise CSV. Empty
+    strings in Parquet output are turned into NaN, as read_csv does.
+    """
+    if Path(path).suffix == '.parquet':
+        return pd.read_parquet(path).replace('', np.nan)
+    return pd.read_csv(path)
+
 def main():
     print("="*70)
     print("NCO → O*NET → AI Automatability Mapping")
@@ -1034,22 +1045,26 @@ def main():
     
     # Load NCO-ONET crosswalk
     print("3. Loading NCO-ONET crosswalk...")
-    crosswalk = pd.read_csv('/mnt/user-data/uploads/nco_onet_crosswalk.csv')
+    crosswalk = load_crosswalk('/mnt/user-data/uploads/nco_onet_crosswalk.csv')
     print(f"   Loaded {len(crosswalk)} NCO occupation mappings")
     print(f"   Unique O*NET codes: {crosswalk['ONET_Code'].nunique()}")
     print()
     
     # Apply automatability scores
     print("4. Applying automatability scores...")
-    scores = []
-    match_types = []
-    
-    for _, row in crosswalk.iterrows():
-        score, match_type = get_automatability_score(
-            row['ONET_Code'], score_map, felten_df
-        )
-        scores.append(score)
-        match_types.append(match_type)
+    # Score each distinct O*NET code once and broadcast by category code;
+    # the extra last entry is for missing codes (category code -1)
+    crosswalk['ONET_Code'] = crosswalk['ONET_Code'].astype('category')
+    onet_codes = crosswalk['ONET_Code'].cat
+    results = [
+        get_automatability_score(code, score_map, felten_df)
+        for code in onet_codes.categories
+    ]
+    results.append(get_automatability_score(np.nan, score_map, felten_df))
+    code_scores = np.array([score for score, _ in results], dtype=float)
+    code_match_types = np.array([match_type for _, match_type in results], dtype=object)
+    scores = code_scores[onet_codes.codes]
+    match_types = code_match_types[onet_codes.codes]
     
     crosswalk['LM_AIOE_Raw'] = scores
     crosswalk['Match_Type'] = match_types
@@ -19,7 +19,13 @@ License: MIT
 Version: 1.0.0
 
 Requirements:
+    - numpy
+    - pandas
+    - pyarrow (Parquet cache of extracted records)
+    - pymupdf (fast text extraction; pdfplumber is used when it is missing)
+    - pypdfium2 (optional; permissively licensed alternative to pymupdf)
     - pdfplumber
+    - pyahocorasick (optional; speeds up keyword matching)
     - rapidfuzz
 
 Usage:
@@ -32,7 +38,7 @@ Input Files:
       Available from https://www.onetonline.org/
 
 Output:
-    CSV file with columns:
+    CSV file (or zstd-compressed Parquet when the path ends in .parquet) with columns:
     - NCO_2015_Code: India's 2015 classification code (format: XXXX.XXXX)
     - NCO_2004_Code: Corresponding 2004 code if available (format: XXXX.XX)
     - NCO_Job_Title: Occupation title from NCO
@@ -45,12 +51,38 @@ Output:
         - 60: Division-level fallback
 """
 
-import pdfplumber
 import re
-import csv
 import argparse
+import hashlib
+import json
 import os
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from types import MappingProxyType
+from typing import Dict, Final, Iterator, List, Mapping, NamedTuple, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 
 # =============================================================================
@@ -336,13 +368,53 @@ SEMANTIC_KEYWORDS: Dict[str, Tuple[str, str]] = {
 }
 
 
+# Keywords longest first (ties keep dictionary order), so the best hit in a
+# title is the one with the lowest index
+_KEYWORDS = np.array(sorted(SEMANTIC_KEYWORDS, key=len, reverse=True), dtype=object)
+_KEYWORD_INDEX: Dict[str, int] = {keyword: i for i, keyword in enumerate(_KEYWORDS)}
+
+# Single alternation over all keywords, longest first. The lookahead reports
+# the longest keyword starting at every position, including overlapping ones.
+_KEYWORD_PATTERN = re.compile('(?=(' + '|'.join(map(re.escape, _KEYWORDS)) + '))')
+
+
+def _build_keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over the keyword table.
+    
+    Each keyword carries its _KEYWORDS index, so the lowest index among the
+    matches in a title is the keyword the longest-first scan would pick.
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, index in _KEYWORD_INDEX.items():
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _keyword_index(title_lower: str) -> int:
+    """Return the _KEYWORDS index of the best keyword in a lower-cased title, or -1."""
+    if _KEYWORD_AUTOMATON is not None:
+        hits = (index for _, index in _KEYWORD_AUTOMATON.iter(title_lower))
+    else:
+        hits = map(_KEYWORD_INDEX.__getitem__, _KEYWORD_PATTERN.findall(title_lower))
+    return min(hits, default=-1)
+
+
 # =============================================================================
 # NCO PREFIX TO O*NET FALLBACK MAPPINGS
 # =============================================================================
 # These provide fallback mappings based on the NCO hierarchical code structure.
 # The first 4 digits of NCO codes indicate the occupational unit group.
+# Both tables are read-only views; the lookup tables below are derived from them.
 
-NCO_PREFIX_DEFAULTS: Dict[str, Tuple[str, str]] = {
+NCO_PREFIX_DEFAULTS: Final[Mapping[str, Tuple[str, str]]] = MappingProxyType({
     # -------------------------------------------------------------------------
     # Division 1: Managers
     # -------------------------------------------------------------------------
@@ -808,10 +880,10 @@ NCO_PREFIX_DEFAULTS: Dict[str, Tuple[str, str]] = {
     '9623': ('43-5041.00', 'Meter Readers, Utilities'),
     '9624': ('53-7199.00', 'Material Moving Workers, All Other'),
     '9629': ('39-6011.00', 'Baggage Porters and Bellhops'),
-}
+})
 
 # Division-level fallback defaults
-DIVISION_DEFAULTS: Dict[str, Tuple[str, str]] = {
+DIVISION_DEFAULTS: Final[Mapping[str, Tuple[str, str]]] = MappingProxyType({
     '1': ('11-1021.00', 'General and Operations Managers'),
     '2': ('19-4099.00', 'Life, Physical, and Social Science Technicians, All Other'),
     '3': ('17-3029.00', 'Engineering Technologists and Technicians, Except Drafters, All Other'),
@@ -821,32 +893,315 @@ DIVISION_DEFAULTS: Dict[str, Tuple[str, str]] = {
     '7': ('51-9199.00', 'Production Workers, All Other'),
     '8': ('51-8099.00', 'Plant and System Operators, All Other'),
     '9': ('53-7199.00', 'Material Moving Workers, All Other'),
-}
+})
+
+
+class OnetEntry(NamedTuple):
+    """An O*NET occupation the mapping tables can assign."""
+    code: str
+    title: str
+
+
+# Every distinct O*NET (code, title) pair the tables above can assign, with
+# ('', '') last for "no match". The lookup arrays below hold indices into
+# this list, and match results are built as categoricals over it. Entries
+# compare and hash equal to the plain tuples in the tables.
+ONET_ENTRIES: List[OnetEntry] = [OnetEntry._make(entry) for entry in dict.fromkeys([
+    *SEMANTIC_KEYWORDS.values(),
+    *NCO_PREFIX_DEFAULTS.values(),
+    *DIVISION_DEFAULTS.values(),
+    ('', ''),
+])]
+_ENTRY_INDEX: Dict[Tuple[str, str], int] = {entry: i for i, entry in enumerate(ONET_ENTRIES)}
+_NO_MATCH = _ENTRY_INDEX[('', '')]
+
+# Category codes and categories of each entry's code and title
+_ENTRY_CODE_CODES, _ENTRY_CODE_CATEGORIES = pd.Index([entry.code for entry in ONET_ENTRIES]).factorize()
+_ENTRY_TITLE_CODES, _ENTRY_TITLE_CATEGORIES = pd.Index([entry.title for entry in ONET_ENTRIES]).factorize()
+
+# ONET_ENTRIES index of each keyword in _KEYWORDS
+_KEYWORD_ENTRY = np.array([_ENTRY_INDEX[SEMANTIC_KEYWORDS[k]] for k in _KEYWORDS], dtype=np.intp)
+
+
+def _build_prefix_table():
+    """
+    Resolve the prefix and division tiers for every possible 4-digit prefix.
+    
+    Returns (table, scores), with one slot per prefix (0000-9999): table
+    holds the ONET_ENTRIES index of the most specific default (4-digit,
+    3-digit, then division) and scores holds 80, 75 or 60 accordingly, so
+    one lookup walks the whole NCO hierarchy. Prefixes outside every
+    division get _NO_MATCH with score 0.
+    """
+    table = np.full(10000, _NO_MATCH, dtype=np.int16)
+    scores = np.zeros(10000, dtype=np.int64)
+    
+    # Division tier: the first digit covers its 1000 prefixes
+    for division, value in DIVISION_DEFAULTS.items():
+        start = int(division) * 1000
+        table[start:start + 1000] = _ENTRY_INDEX[value]
+        scores[start:start + 1000] = 60
+    
+    # 3-digit tier: 'xyz0' covers every prefix xyz0-xyz9 without its own entry
+    for prefix, value in NCO_PREFIX_DEFAULTS.items():
+        if prefix.endswith('0'):
+            start = int(prefix)
+            table[start:start + 10] = _ENTRY_INDEX[value]
+            scores[start:start + 10] = 75
+    
+    # 4-digit tier takes precedence over both
+    for prefix, value in NCO_PREFIX_DEFAULTS.items():
+        table[int(prefix)] = _ENTRY_INDEX[value]
+        scores[int(prefix)] = 80
+    
+    return table, scores
+
+
+_PREFIX_TABLE, _PREFIX_SCORES = _build_prefix_table()
+
+
+def _build_prefix_matches() -> Dict[str, Tuple[str, str, int]]:
+    """
+    Map each 4-digit prefix with a prefix-tier match to its finished result.
+    
+    Scalar lookups then take a single dict probe that returns a ready
+    (onet_code, onet_title, score) tuple, shared by all prefixes with the
+    same result, instead of probing the 4-digit and 3-digit tiers in turn.
+    Division results are left to the small DIVISION_DEFAULTS dict.
+    """
+    results = {}
+    matches = {}
+    for slot, (entry, score) in enumerate(zip(_PREFIX_TABLE.tolist(), _PREFIX_SCORES.tolist())):
+        if score > 60:
+            matches[f'{slot:04d}'] = results.setdefault((entry, score), (*ONET_ENTRIES[entry], score))
+    return matches
+
+
+_PREFIX_MATCHES = _build_prefix_matches()
 
 
 # =============================================================================
 # DATA EXTRACTION FUNCTIONS
 # =============================================================================
 
-def extract_nco_records(pdf_path: str) -> List[Dict[str, str]]:
+# Pages handed to a worker process at a time when extracting in parallel
+PAGES_PER_TASK = 8
+
+# Bump when extraction or parsing changes so cached records are rebuilt
+PARSER_VERSION = 2
+
+# NCO concordance lines: "NCO2015 Title NCO2004" or "NCO2015 Title"
+_NCO_FULL_RE = re.compile(r'^(\d{4}\.\d{4})\s+(.+?)\s+(\d{4}\.\d{2})$')
+_NCO_PARTIAL_RE = re.compile(r'^(\d{4}\.\d{4})\s+(.+)$')
+_NCO2004_SUFFIX_RE = re.compile(r'\d{4}\.\d{2}$')
+
+# O*NET list lines: "[Job Zone | Not available] Code Title [Bright Outlook]"
+_ONET_RE = re.compile(r'^(?:Not available|\d)?\s*(\d{2}-\d{4}\.\d{2})\s+(.+?)(?:\s+Bright Outlook)?$')
+
+
+# Text extraction libraries, fastest first
+PDF_BACKENDS = ('pymupdf', 'pypdfium2', 'pdfplumber')
+
+# PDFium marks a word hyphenated across a line break with U+FFFE
+_PDFIUM_WORD_RE = re.compile(r'[^\s\ufffe]+\ufffe?')
+
+# An NCO or O*NET code alone on its line: a table row split across lines
+_ORPHAN_CODE_RE = re.compile(r'^[ \t]*(?:\d{4}\.\d{2}(?:\d{2})?|\d{2}-\d{4}\.\d{2})[ \t]*$', re.MULTILINE)
+
+
+def _group_lines(words: List[Tuple[float, float, str]], y_tolerance: float = 3) -> str:
+    """
+    Rebuild visual text lines from (x0, top, text) word boxes.
+    
+    Words are grouped by their top coordinate (within y_tolerance, as
+    pdfplumber does) and joined left to right. This keeps codes and titles
+    on the same line for the line-based record parsers below.
+    """
+    words = sorted(words, key=lambda w: (w[1], w[0]))
+    lines = []
+    current = []
+    top = None
+    for word in words:
+        if top is None or abs(word[1] - top) > y_tolerance:
+            if current:
+                lines.append(current)
+            current = []
+            top = word[1]
+        current.append(word)
+    if current:
+        lines.append(current)
+    return "\n".join(
+        " ".join(w[2] for w in sorted(line, key=lambda w: w[0])) for line in lines
+    )
+
+
+def _page_lines(page) -> str:
+    """
+    Rebuild the visual text lines of a PyMuPDF page.
+    
+    PyMuPDF reports each table cell as its own line, so the lines are
+    rebuilt from its word boxes.
+    """
+    return _group_lines([(w[0], w[1], w[4]) for w in page.get_text("words")])
+
+
+def _pdfium_page_lines(page) -> str:
+    """
+    Rebuild the visual text lines of a pypdfium2 page.
+    
+    PDFium has no word boxes, so words are split from the page text and
+    placed at the loose (font-height) box of their first character, which
+    lines up with pdfplumber's top coordinate.
+    """
+    textpage = page.get_textpage()
+    height = page.get_height()
+    words = []
+    for match in _PDFIUM_WORD_RE.finditer(textpage.get_text_range()):
+        left, _, _, top = textpage.get_charbox(match.start(), loose=True)
+        words.append((left, height - top, match.group().replace('\ufffe', '-')))
+    textpage.close()
+    return _group_lines(words)
+
+
+def _installed_backends() -> List[str]:
+    """Return the names of the installed PDF backends, fastest first."""
+    modules = (pymupdf, pdfium, pdfplumber)
+    return [name for name, module in zip(PDF_BACKENDS, modules) if module is not None]
+
+
+def _resolve_backend(backend: Optional[str] = None) -> str:
+    """Return backend, or the fastest installed one if None; raise ImportError if unavailable."""
+    installed = _installed_backends()
+    if not installed:
+        raise ImportError("PDF extraction requires pymupdf, pypdfium2 or pdfplumber")
+    backend = backend or installed[0]
+    if backend not in installed:
+        raise ImportError(f"PDF backend '{backend}' is not installed")
+    return backend
+
+
+def _plumber_page_text(page) -> str:
+    """Extract a pdfplumber page's text and release its parsed objects."""
+    text = page.extract_text() or ''
+    page.close()
+    return text
+
+
+def _retry_if_malformed(pdf_path: str, index: int, text: str) -> str:
+    """
+    Return a fast-backend page text, re-extracted with pdfplumber if it looks malformed.
+    
+    A code left alone on its line means a table row came apart, which the
+    line-based parsers would drop or misread. Only those pages pay for
+    pdfplumber's layout analysis.
+    """
+    if pdfplumber is None or not _ORPHAN_CODE_RE.search(text):
+        return text
+    with pdfplumber.open(pdf_path) as pdf:
+        return _plumber_page_text(pdf.pages[index])
+
+
+def _iter_page_range(pdf_path: str, start: int = 0, stop: Optional[int] = None,
+                     backend: str = 'pymupdf') -> Iterator[str]:
+    """
+    Yield the text of pages [start, stop) of a PDF, one string per page.
+    
+    Each page is released before the next is read, so memory use does not
+    grow with the length of the PDF. Pages read by a fast backend whose text
+    looks malformed are re-extracted with pdfplumber when it is installed.
+    """
+    if backend == 'pymupdf':
+        with pymupdf.open(pdf_path) as doc:
+            stop = len(doc) if stop is None else stop
+            for i in range(start, stop):
+                yield _retry_if_malformed(pdf_path, i, _page_lines(doc[i]))
+    elif backend == 'pypdfium2':
+        doc = pdfium.PdfDocument(pdf_path)
+        try:
+            stop = len(doc) if stop is None else stop
+            for i in range(start, stop):
+                page = doc[i]
+                text = _pdfium_page_lines(page)
+                page.close()
+                yield _retry_if_malformed(pdf_path, i, text)
+        finally:
+            doc.close()
+    else:
+        # pdfplumber keeps every page it has parsed until it is closed
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages[start:stop]:
+                yield _plumber_page_text(page)
+
+
+def _extract_page_range(pdf_path: str, start: int = 0, stop: Optional[int] = None,
+                        backend: str = 'pymupdf') -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF (worker process entry point)."""
+    return list(_iter_page_range(pdf_path, start, stop, backend))
+
+
+def _page_count(pdf_path: str, backend: str = 'pymupdf') -> int:
+    """Return the number of pages in a PDF."""
+    if backend == 'pymupdf':
+        with pymupdf.open(pdf_path) as doc:
+            return len(doc)
+    if backend == 'pypdfium2':
+        doc = pdfium.PdfDocument(pdf_path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+
+def _iter_pages(pdf_path: str, workers: int = 1, backend: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield the text of each page of a PDF, in page order.
+    
+    By default uses PyMuPDF when it is installed (an order of magnitude
+    faster than pdfminer-based extraction), then pypdfium2, then pdfplumber.
+    All backends produce the same lines on the bundled PDFs. With workers > 1,
+    pages are extracted in batches of PAGES_PER_TASK by a process pool, each
+    worker opening its own document handle; otherwise pages are read one at a time as the
+    caller consumes them.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        workers: Number of worker processes
+        backend: One of PDF_BACKENDS, or None for the fastest installed one
+        
+    Yields:
+        One newline-separated text string per page
+    """
+    backend = _resolve_backend(backend)
+    
+    if workers <= 1:
+        yield from _iter_page_range(pdf_path, backend=backend)
+        return
+    
+    n_pages = _page_count(pdf_path, backend)
+    starts = range(0, n_pages, PAGES_PER_TASK)
+    stops = [min(start + PAGES_PER_TASK, n_pages) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = executor.map(_extract_page_range, repeat(pdf_path), starts, stops, repeat(backend))
+        for batch in batches:
+            yield from batch
+
+
+def extract_nco_records(pdf_path: str, workers: int = 1,
+                        backend: Optional[str] = None) -> List[Dict[str, str]]:
     """
     Extract NCO occupation records from the NCO 2015 PDF.
     
     Args:
         pdf_path: Path to the NCO 2015 PDF file
+        workers: Number of processes used for page extraction
+        backend: PDF library to use (see _iter_pages)
         
     Returns:
         List of dictionaries with keys: nco2015, title, nco2004
     """
-    all_text = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                all_text.append(text)
-    
-    full_text = "\n".join(all_text)
-    lines = full_text.split('\n')
+    lines = (line for page in _iter_pages(pdf_path, workers, backend) for line in page.split('\n'))
     records = []
     
     for line in lines:
@@ -861,7 +1216,7 @@ def extract_nco_records(pdf_path: str) -> List[Dict[str, str]]:
             continue
         
         # Pattern: NCO2015 Title NCO2004
-        match = re.match(r'^(\d{4}\.\d{4})\s+(.+?)\s+(\d{4}\.\d{2})$', line)
+        match = _NCO_FULL_RE.match(line)
         if match:
             records.append({
                 'nco2015': match.group(1),
@@ -871,8 +1226,8 @@ def extract_nco_records(pdf_path: str) -> List[Dict[str, str]]:
             continue
         
         # Pattern: NCO2015 Title (no NCO2004)
-        match2 = re.match(r'^(\d{4}\.\d{4})\s+(.+)$', line)
-        if match2 and not re.search(r'\d{4}\.\d{2}$', line):
+        match2 = _NCO_PARTIAL_RE.match(line)
+        if match2 and not _NCO2004_SUFFIX_RE.search(line):
             records.append({
                 'nco2015': match2.group(1),
                 'title': match2.group(2).strip(),
@@ -882,25 +1237,20 @@ def extract_nco_records(pdf_path: str) -> List[Dict[str, str]]:
     return records
 
 
-def extract_onet_records(pdf_path: str) -> List[Dict[str, str]]:
+def extract_onet_records(pdf_path: str, workers: int = 1,
+                         backend: Optional[str] = None) -> List[Dict[str, str]]:
     """
     Extract O*NET occupation records from the O*NET PDF.
     
     Args:
         pdf_path: Path to the O*NET PDF file
+        workers: Number of processes used for page extraction
+        backend: PDF library to use (see _iter_pages)
         
     Returns:
         List of dictionaries with keys: onet_code, title
     """
-    all_text = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                all_text.append(text)
-    
-    full_text = "\n".join(all_text)
-    lines = full_text.split('\n')
+    lines = (line for page in _iter_pages(pdf_path, workers, backend) for line in page.split('\n'))
     records = []
     
     for line in lines:
@@ -916,30 +1266,79 @@ def extract_onet_records(pdf_path: str) -> List[Dict[str, str]]:
         if 'Save Table' in line or 'Find in list' in line:
             continue
         
-        # Pattern variations for O*NET codes
-        match = re.match(r'^(?:Not available|\d)?\s*(\d{2}-\d{4}\.\d{2})\s+(.+?)(?:\s+Bright Outlook)?$', line)
+        # Covers the Job Zone and "Not available" variants as well
+        match = _ONET_RE.match(line)
         if match:
             records.append({
                 'onet_code': match.group(1),
                 'title': match.group(2).strip()
             })
-            continue
-        
-        match2 = re.match(r'^(\d)\s+(\d{2}-\d{4}\.\d{2})\s+(.+?)(?:\s+Bright Outlook)?$', line)
-        if match2:
-            records.append({
-                'onet_code': match2.group(2),
-                'title': match2.group(3).strip()
-            })
-            continue
+    
+    return records
+
+
+def _file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cached_records(extract, pdf_path: str, cache_dir: Optional[str], workers: int = 1,
+                    backend: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Run an extract_*_records function, reusing its result from cache_dir.
+    
+    Records are stored as Parquet under a name built from the extractor, the
+    resolved PDF backend and the PDF's SHA-256, so an unchanged PDF is parsed
+    only once per backend. A JSON manifest beside each file records
+    PARSER_VERSION; entries written by another version are rebuilt. Both
+    files are replaced atomically.
+    
+    Args:
+        extract: extract_nco_records or extract_onet_records
+        pdf_path: Path to the PDF file
+        cache_dir: Cache directory, or None to always extract
+        workers: Number of processes used for page extraction
+        backend: PDF library to use (see _iter_pages)
         
-        match3 = re.match(r'^Not available\s+(\d{2}-\d{4}\.\d{2})\s+(.+?)(?:\s+Bright Outlook)?$', line)
-        if match3:
-            records.append({
-                'onet_code': match3.group(1),
-                'title': match3.group(2).strip()
-            })
+    Returns:
+        List of record dictionaries, as returned by extract
+    """
+    if cache_dir is None:
+        return extract(pdf_path, workers, backend)
+    
+    # Each backend gets its own entry, so records are only ever served to
+    # runs of the backend that produced them
+    backend = _resolve_backend(backend)
+    digest = _file_digest(pdf_path)
+    key = f"{extract.__name__}_{backend}_{digest[:16]}"
+    cache_path = os.path.join(cache_dir, key + '.parquet')
+    manifest_path = os.path.join(cache_dir, key + '.json')
     
+    if os.path.exists(cache_path) and os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            if json.load(f).get('parser_version') == PARSER_VERSION:
+                return pd.read_parquet(cache_path).to_dict('records')
+    
+    records = extract(pdf_path, workers, backend)
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    # Write under temporary names and rename into place, so an interrupted
+    # or concurrent run never leaves a truncated entry behind
+    suffix = f'.{os.getpid()}.tmp'
+    pd.DataFrame(records).to_parquet(cache_path + suffix, compression='zstd', index=False)
+    with open(manifest_path + suffix, 'w', encoding='utf-8') as f:
+        json.dump({
+            'source': os.path.basename(pdf_path),
+            'sha256': digest,
+            'backend': backend,
+            'parser_version': PARSER_VERSION,
+        }, f, indent=2)
+    os.replace(cache_path + suffix, cache_path)
+    os.replace(manifest_path + suffix, manifest_path)
     return records
 
 
@@ -964,95 +1363,193 @@ def find_semantic_match(title: str, nco_code: str) -> Tuple[str, str, int]:
     Returns:
         Tuple of (onet_code, onet_title, match_score)
     """
-    title_lower = title.lower()
-    
-    # Priority 1: Check semantic keyword matches (longest match first)
-    sorted_keywords = sorted(SEMANTIC_KEYWORDS.keys(), key=len, reverse=True)
-    for keyword in sorted_keywords:
-        if keyword in title_lower:
-            return SEMANTIC_KEYWORDS[keyword][0], SEMANTIC_KEYWORDS[keyword][1], 95
+    index = _keyword_index(title.lower())
+    if index >= 0:
+        entry = ONET_ENTRIES[_KEYWORD_ENTRY[index]]
+        return entry.code, entry.title, 95
     
-    # Priority 2: Use NCO 4-digit prefix fallback
-    prefix = nco_code[:4]
-    if prefix in NCO_PREFIX_DEFAULTS:
-        return NCO_PREFIX_DEFAULTS[prefix][0], NCO_PREFIX_DEFAULTS[prefix][1], 80
+    return _fallback_match(nco_code)
+
+
+def _fallback_match(nco_code: str) -> Tuple[str, str, int]:
+    """Match an NCO code on its prefix or division (priorities 2-4)."""
+    # Priorities 2-3: 4-digit prefix, or its 3-digit group, resolved ahead of time
+    match = _PREFIX_MATCHES.get(nco_code[:4])
+    if match is not None:
+        return match
     
-    # Priority 3: Try 3-digit prefix with trailing zero
+    # Priority 3 for codes whose first four characters are not all digits
     prefix3 = nco_code[:3] + '0'
     if prefix3 in NCO_PREFIX_DEFAULTS:
-        return NCO_PREFIX_DEFAULTS[prefix3][0], NCO_PREFIX_DEFAULTS[prefix3][1], 75
+        return (*NCO_PREFIX_DEFAULTS[prefix3], 75)
     
     # Priority 4: Division-level fallback
-    division = nco_code[0]
+    division = nco_code[:1]
     if division in DIVISION_DEFAULTS:
-        return DIVISION_DEFAULTS[division][0], DIVISION_DEFAULTS[division][1], 60
+        return (*DIVISION_DEFAULTS[division], 60)
     
     return '', '', 0
 
 
+def _hierarchy_entries(nco_codes: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ONET_ENTRIES indices and scores for the prefix/division tiers of a column.
+    Missing codes get _NO_MATCH with score 0; non-string codes raise TypeError.
+    """
+    missing = nco_codes.isna().to_numpy()
+    if missing.all():
+        # Includes the all-NaN float64 column read_csv gives for an empty code column
+        return np.full(len(missing), _NO_MATCH, dtype=np.intp), np.zeros(len(missing), dtype=np.int64)
+    values = nco_codes.cat.categories if isinstance(nco_codes.dtype, pd.CategoricalDtype) else nco_codes
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind != 'string':
+        raise TypeError(f"NCO codes must be strings, got {kind} values "
+                        f"(read the code column with dtype=str)")
+    
+    prefixes = nco_codes.str[:4]
+    numeric = prefixes.str.fullmatch(r'[0-9]{4}').fillna(False).to_numpy(dtype=bool)
+    
+    # The dense table is indexed by the prefix as an integer; the odd code
+    # that does not start with four digits takes the scalar path
+    slots = prefixes[numeric].astype(np.int64).to_numpy()
+    entries = np.full(len(prefixes), _NO_MATCH, dtype=np.intp)
+    scores = np.zeros(len(prefixes), dtype=np.int64)
+    entries[numeric] = _PREFIX_TABLE[slots]
+    scores[numeric] = _PREFIX_SCORES[slots]
+    for i in np.flatnonzero(~numeric & ~missing):
+        code, title, scores[i] = _fallback_match(nco_codes.iloc[i])
+        entries[i] = _ENTRY_INDEX[code, title]
+    return entries, scores
+
+
+def _entries_frame(entries: np.ndarray, scores: np.ndarray, index: pd.Index) -> pd.DataFrame:
+    """Build the ONET_Code/ONET_Job_Title/Match_Score frame for ONET_ENTRIES indices."""
+    return pd.DataFrame({
+        'ONET_Code': pd.Categorical.from_codes(_ENTRY_CODE_CODES[entries], _ENTRY_CODE_CATEGORIES),
+        'ONET_Job_Title': pd.Categorical.from_codes(_ENTRY_TITLE_CODES[entries], _ENTRY_TITLE_CATEGORIES),
+        'Match_Score': scores,
+    }, index=index)
+
+
+def classify(nco_codes: pd.Series) -> pd.DataFrame:
+    """
+    Map NCO codes to O*NET on the code hierarchy alone (priorities 2-4).
+    
+    This is the fallback half of find_semantic_match for a whole column:
+    each code's 4-digit prefix is looked up in the dense prefix table, with
+    no per-row dict lookups.
+    
+    Args:
+        nco_codes: NCO 2015 codes as strings; missing values (including a
+            column that is entirely NaN) are allowed
+        
+    Returns:
+        DataFrame indexed like nco_codes with categorical columns ONET_Code
+        and ONET_Job_Title, and integer column Match_Score (80, 75 or 60;
+        0 with empty ONET columns for missing or unmatched codes)
+        
+    Raises:
+        TypeError: If nco_codes holds non-string values, such as the float
+            column pd.read_csv makes of codes like 2310.0100
+    """
+    entries, scores = _hierarchy_entries(nco_codes)
+    return _entries_frame(entries, scores, nco_codes.index)
+
+
+def match_titles(titles: pd.Series, nco_codes: pd.Series) -> pd.DataFrame:
+    """
+    Apply find_semantic_match to a whole column of NCO records.
+    
+    Titles are lower-cased once for the column rather than once per call;
+    each row then needs a single automaton (or regex) pass. Keyword hits and
+    prefix/division fallbacks are each resolved with one gather from the
+    keyword table and the dense prefix table, as ONET_ENTRIES indices.
+    
+    Args:
+        titles: NCO occupation titles
+        nco_codes: NCO 2015 codes, aligned with titles (see classify)
+        
+    Returns:
+        DataFrame indexed like titles with categorical columns ONET_Code
+        and ONET_Job_Title, and integer column Match_Score
+        
+    Raises:
+        TypeError: If a code that needs the prefix fallback is not a string
+    """
+    n = len(titles)
+    index = np.fromiter(map(_keyword_index, titles.str.lower()), dtype=np.intp, count=n)
+    hit = index >= 0
+    
+    entries = np.full(n, _NO_MATCH, dtype=np.intp)
+    scores = np.where(hit, 95, 0)
+    entries[hit] = _KEYWORD_ENTRY[index[hit]]
+    
+    # Prefix and division tiers: one lookup in the dense prefix table for
+    # all other rows
+    rest = np.flatnonzero(~hit)
+    entries[rest], scores[rest] = _hierarchy_entries(nco_codes.iloc[rest])
+    
+    return _entries_frame(entries, scores, titles.index)
+
+
 # =============================================================================
 # MAIN PROCESSING FUNCTION
 # =============================================================================
 
-def create_crosswalk(nco_pdf: str, onet_pdf: str, output_path: str) -> Dict[str, any]:
+def create_crosswalk(nco_pdf: str, onet_pdf: str, output_path: str, workers: int = 1,
+                     cache_dir: Optional[str] = None, backend: Optional[str] = None) -> Dict[str, any]:
     """
     Create the NCO to O*NET crosswalk mapping.
     
     Args:
         nco_pdf: Path to NCO 2015 PDF
         onet_pdf: Path to O*NET PDF
-        output_path: Path for output CSV file
+        output_path: Path for the output CSV file, or Parquet file if it ends in .parquet
+        workers: Number of processes used for PDF page extraction
+        cache_dir: Directory for cached PDF extractions (None disables caching)
+        backend: PDF library to use, one of PDF_BACKENDS (default: fastest installed)
         
     Returns:
         Dictionary with statistics about the mapping
     """
     # Extract records
     print("Extracting NCO data...")
-    nco_records = extract_nco_records(nco_pdf)
+    nco_records = _cached_records(extract_nco_records, nco_pdf, cache_dir, workers, backend)
     print(f"Total NCO records: {len(nco_records)}")
     
     print("Extracting O*NET data...")
-    onet_records = extract_onet_records(onet_pdf)
+    onet_records = _cached_records(extract_onet_records, onet_pdf, cache_dir, workers, backend)
     print(f"Total O*NET records: {len(onet_records)}")
     
     # Create mapping
     print("\nCreating semantic crosswalk mapping...")
-    mapping = []
-    
-    for i, nco in enumerate(nco_records):
-        onet_code, onet_title, match_score = find_semantic_match(nco['title'], nco['nco2015'])
-        mapping.append({
-            'NCO_2015_Code': nco['nco2015'],
-            'NCO_2004_Code': nco['nco2004'],
-            'NCO_Job_Title': nco['title'],
-            'ONET_Code': onet_code,
-            'ONET_Job_Title': onet_title,
-            'Match_Score': match_score
-        })
-        
-        if (i + 1) % 500 == 0:
-            print(f"Processed {i+1}/{len(nco_records)} records...")
-    
-    # Save to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'NCO_2015_Code', 'NCO_2004_Code', 'NCO_Job_Title',
-            'ONET_Code', 'ONET_Job_Title', 'Match_Score'
-        ])
-        writer.writeheader()
-        writer.writerows(mapping)
+    nco = pd.DataFrame(nco_records, columns=['nco2015', 'title', 'nco2004'])
+    matches = match_titles(nco['title'], nco['nco2015'])
+    mapping = pd.DataFrame({
+        'NCO_2015_Code': nco['nco2015'],
+        'NCO_2004_Code': nco['nco2004'],
+        'NCO_Job_Title': nco['title'],
+    }).join(matches)
+    
+    # Save as Parquet when asked for, otherwise as CSV (CRLF line endings, as
+    # written by the csv module before)
+    if output_path.endswith('.parquet'):
+        mapping.to_parquet(output_path, compression='zstd', index=False)
+    else:
+        mapping.to_csv(output_path, index=False, encoding='utf-8', lineterminator='\r\n')
     
     print(f"\nMapping saved to: {output_path}")
     
     # Calculate statistics
+    scores = mapping['Match_Score']
     stats = {
         'total_records': len(mapping),
-        'semantic_matches': sum(1 for m in mapping if m['Match_Score'] >= 90),
-        'prefix_matches': sum(1 for m in mapping if 80 <= m['Match_Score'] < 90),
-        'division_matches': sum(1 for m in mapping if 60 <= m['Match_Score'] < 80),
-        'low_matches': sum(1 for m in mapping if 0 < m['Match_Score'] < 60),
-        'no_matches': sum(1 for m in mapping if m['Match_Score'] == 0),
-        'nco2004_coverage': sum(1 for m in mapping if m['NCO_2004_Code']),
+        'semantic_matches': int((scores >= 90).sum()),
+        'prefix_matches': int(scores.between(80, 89).sum()),
+        'division_matches': int(scores.between(60, 79).sum()),
+        'low_matches': int(scores.between(1, 59).sum()),
+        'no_matches': int((scores == 0).sum()),
+        'nco2004_coverage': int((mapping['NCO_2004_Code'] != '').sum()),
     }
     
     return stats
@@ -1107,7 +1604,33 @@ Examples:
     parser.add_argument(
         '--output', '-out',
         default='nco_onet_crosswalk.csv',
-        help='Output CSV file path (default: nco_onet_crosswalk.csv)'
+        help='Output file path; a .parquet extension writes Parquet instead of CSV '
+             '(default: nco_onet_crosswalk.csv)'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Processes used to extract PDF pages (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=PDF_BACKENDS,
+        help='PDF library used for text extraction (default: fastest installed)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default='.cache',
+        help='Directory for cached PDF extractions (default: .cache)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-extract the PDFs instead of using the cache'
     )
     
     args = parser.parse_args()
@@ -1121,8 +1644,16 @@ Examples:
         print(f"Error: O*NET PDF file not found: {args.onet}")
         return 1
     
+    try:
+        _resolve_backend(args.backend)
+    except ImportError as e:
+        print(f"Error: {e}")
+        return 1
+    
     # Create crosswalk
-    stats = create_crosswalk(args.nco, args.onet, args.output)
+    cache_dir = None if args.no_cache else args.cache_dir
+    stats = create_crosswalk(args.nco, args.onet, args.output, args.workers, cache_dir,
+                             args.backend)
     print_validation_report(stats)
     
     return 0
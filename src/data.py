@@ -1,19 +1,42 @@
 import pandas as pd
 import numpy as np
 import os
+import streamlit as st
+
+try:
+    import orjson  # optional; parses the district GeoJSON about 3x faster
+except ImportError:
+    orjson = None
 
-ICEBERG_PATH = "data/district_iceberg_indices_filled.csv"
 ICEBERG_PATH = "data/district_iceberg_indices_filled.csv"
 GEOJSON_PATH = "data/india_districts_filled.geojson"
 CENSUS_PATH = "data/india.csv"
 
+def _mtime(path):
+    """Modification time of a file, or None if it does not exist."""
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+def data_version(df):
+    """
+    Modification times of the files df was loaded from, as recorded by load_data.
+    Caches of values derived from df are keyed on this rather than on a fresh
+    stat, which could be newer than the frame a fragment rerun still holds.
+    """
+    return df.attrs['data_version']
+
 def load_data():
     """
     Load pre-filled Iceberg Index data (with coordinates) and Census demographics.
+    The result is cached until either input file changes on disk.
     Returns:
-        df: Merged DataFrame
+        df: Merged DataFrame; data_version(df) gives the file version it was loaded from
         stats: Dictionary of summary statistics
     """
+    return _load_data(_mtime(ICEBERG_PATH), _mtime(CENSUS_PATH))
+
+@st.cache_data(show_spinner="Loading data...", max_entries=1)
+def _load_data(iceberg_mtime, census_mtime):
+    """Cached body of load_data; the modification times only key the cache."""
     # 1. Load Iceberg Data (Filled)
     if not os.path.exists(ICEBERG_PATH):
         raise FileNotFoundError(f"Iceberg Index file not found at {ICEBERG_PATH}")
@@ -87,13 +110,72 @@ def load_data():
         "avg_surface_index": np.average(df['surface_index'].fillna(0), weights=df['total_employment']),
     }
     
+    df.attrs['data_version'] = (iceberg_mtime, census_mtime)
     return df, stats
 
 def load_geojson():
-    """Lengths the GeoJSON file for the interactive map."""
-    import json
+    """
+    Load the GeoJSON file for the interactive map.
+    The parsed dict is shared by all sessions, so callers must not modify it.
+    It is reloaded when the file changes on disk.
+    Returns:
+        geojson: Parsed GeoJSON dict, or None if the file is missing
+        version: Modification time of the file it was loaded from
+    """
+    version = _mtime(GEOJSON_PATH)
+    return _load_geojson(version), version
+
+@st.cache_resource(show_spinner="Loading map boundaries...", max_entries=1)
+def _load_geojson(geojson_mtime):
+    """Cached body of load_geojson; the modification time only keys the cache."""
     if not os.path.exists(GEOJSON_PATH):
         return None
-    with open(GEOJSON_PATH, 'r') as f:
-        geojson = json.load(f)
-    return geojson
+    if orjson is not None:
+        with open(GEOJSON_PATH, 'rb') as f:
+            geojson = orjson.loads(f.read())
+    else:
+        import json
+        with open(GEOJSON_PATH, 'r') as f:
+            geojson = json.load(f)
+    return _trim_geojson(geojson)
+
+def _trim_geojson(geojson, ndigits=3):
+    """
+    Keep only what the choropleth draws: each district's geometry and its
+    'District' name (the featureidkey). The whole dict is serialized and sent
+    to the browser on every render of the map, so coordinates are also
+    rounded to ndigits decimal places (about 110 m at 3) and the repeated
+    points this creates are dropped. Only Polygon and MultiPolygon geometries
+    are rounded; any other geometry (or none) is passed through unchanged.
+    """
+    def round_point(point):
+        # Longitude and latitude only; any altitude is kept as is
+        return [round(point[0], ndigits), round(point[1], ndigits), *point[2:]]
+
+    def round_ring(ring):
+        rounded = []
+        for point in ring:
+            point = round_point(point)
+            if not rounded or point != rounded[-1]:
+                rounded.append(point)
+        # A closed ring needs at least four points; keep tiny rings whole
+        if len(rounded) < 4:
+            rounded = [round_point(point) for point in ring]
+        return rounded
+
+    features = []
+    for feature in geojson['features']:
+        geometry = feature['geometry']
+        geometry_type = geometry['type'] if geometry else None
+        if geometry_type == 'Polygon':
+            coordinates = [round_ring(ring) for ring in geometry['coordinates']]
+            geometry = {'type': geometry_type, 'coordinates': coordinates}
+        elif geometry_type == 'MultiPolygon':
+            coordinates = [[round_ring(ring) for ring in polygon] for polygon in geometry['coordinates']]
+            geometry = {'type': geometry_type, 'coordinates': coordinates}
+        features.append({
+            'type': 'Feature',
+            'properties': {'District': (feature.get('properties') or {}).get('District')},
+            'geometry': geometry,
+        })
+    return {'type': 'FeatureCollection', 'features': features}
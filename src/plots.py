@@ -1,8 +1,12 @@
 import plotly.express as px
-import plotly.graph_objects as go
-import pydeck as pdk
+import plotly.io as pio
 import pandas as pd
 
+# Streamlit serializes figures with plotly.io.to_json. When orjson is
+# installed Plotly's "auto" engine switches to it, but its cleaning pass over
+# the choropleth's GeoJSON makes it ~3x slower than the stdlib encoder.
+pio.json.config.default_engine = "json"
+
 def plot_histogram(df, col, title, color_seq):
     fig = px.histogram(
         df, 
@@ -36,7 +40,8 @@ def plot_scatter(df, x_col, y_col, size_col, color_col, hover_data, labels=None)
         labels=labels,
         title=title_text,
         color_continuous_scale="RdYlGn_r", # High iceberg index is usually "risk", so Red? Or Blue? Let's use Red for high exposure.
-        trendline="ols"
+        trendline="ols",
+        render_mode="webgl" # Points drawn with WebGL rather than one SVG node each
     )
     return fig
 
@@ -1,9 +1,77 @@
 import streamlit as st
 import pandas as pd
-from src.plots import plot_histogram, plot_scatter, create_choropleth
+from src.data import data_version
+
+# src.plots (and with it Plotly) is imported inside the functions that draw
+# charts, so the Methodology page never loads it.
+
+@st.cache_resource(show_spinner="Drawing map...", max_entries=1)
+def _choropleth(_df, _geojson, version):
+    """
+    District choropleth for the map page, built once per version of the
+    district data and the GeoJSON.
+    The figure is shared by all sessions, so callers must not modify it.
+    """
+    from src.plots import create_choropleth
+    return create_choropleth(_df, _geojson)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _top_districts(_df, version):
+    """The ten most exposed districts for the dashboard; keyed like _state_aggregation."""
+    return _df.nlargest(10, 'iceberg_index')[['District_Name', 'State_Name', 'iceberg_index', 'total_employment']]
+
+@st.cache_resource(show_spinner=False, max_entries=48)
+def _scatter(_plot_df, x_col, hover_cols, labels, states, version):
+    """
+    Iceberg Index scatter for the analysis page, keyed on the state filter and data version.
+    The figure is shared by all sessions, so callers must not modify it.
+    """
+    from src.plots import plot_scatter
+    return plot_scatter(_plot_df, x_col, "iceberg_index", "total_employment", "iceberg_index",
+                        hover_cols, labels=labels)
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _district_options(_df, version):
+    """Sorted district names for the district search; keyed like _state_aggregation."""
+    return tuple(sorted(_df['District_Name'].unique()))
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _state_aggregation(_df, version):
+    """
+    Per-state summary statistics for the State Aggregation tab, highest Iceberg Mean first.
+    The frame is not hashed; the cache is keyed on the data version it was loaded from.
+    """
+    # Comprehensive Aggregation
+    agg_cols = {
+        'iceberg_index': ['mean', 'std', 'min', 'max'],
+        'surface_index': ['mean', 'std', 'min', 'max'],
+        'surprise_index': ['mean', 'std', 'min', 'max'],
+        'District_Name': 'count'
+    }
+    
+    state_agg = _df.groupby('State_Name').agg(agg_cols).reset_index()
+    
+    # Flatten MultiIndex Columns
+    state_agg.columns = [
+        'State/UT',
+        'Iceberg Mean', 'Iceberg SD', 'Iceberg Min', 'Iceberg Max',
+        'Surface Mean', 'Surface SD', 'Surface Min', 'Surface Max',
+        'Surprise Mean', 'Surprise SD', 'Surprise Min', 'Surprise Max',
+        'Districts (n)'
+    ]
+    
+    # Reorder columns to match Appendix style: State, n, Iceberg stats, Surface stats, Surprise stats
+    cols_order = ['State/UT', 'Districts (n)', 
+                  'Iceberg Mean', 'Iceberg SD', 'Iceberg Min', 'Iceberg Max',
+                  'Surface Mean', 'Surface SD', 'Surface Min', 'Surface Max',
+                  'Surprise Mean', 'Surprise SD', 'Surprise Min', 'Surprise Max']
+    
+    return state_agg[cols_order].sort_values('Iceberg Mean', ascending=False)
 
 def render_dashboard(df, stats):
-    """Render the main dashboard."""
+    """Render the main dashboard. df must be the frame returned by load_data."""
+    from src.plots import plot_histogram
+    
     st.header("🇮🇳 India Iceberg Index")
     
     # Top Metrics
@@ -34,7 +102,7 @@ def render_dashboard(df, stats):
         st.caption("Distribution of districts by their AI exposure score.")
         
     with col_dist2:
-        top_districts = df.nlargest(10, 'iceberg_index')[['District_Name', 'State_Name', 'iceberg_index', 'total_employment']]
+        top_districts = _top_districts(df, data_version(df))
         st.write("Top 10 Districts by Exposure")
         st.dataframe(top_districts, hide_index=True)
 
@@ -56,15 +124,19 @@ def render_dashboard(df, stats):
         st.subheader("📚 Methodology")
         st.write("Learn how the index was constructed. Adapts the **Felten et al. (2023)** methodology using Indian NCO codes, PLFS 2024 workforce data, and spatial backfilling techniques.")
 
-def render_map(df, geojson):
-    """Render the geographic analysis map."""
+def render_map(df, geojson, geojson_version):
+    """
+    Render the geographic analysis map.
+    df must be the frame returned by load_data, and geojson and
+    geojson_version the pair returned by load_geojson.
+    """
     st.header("🗺️ Geographic Exposure Map")
     
     # 1. Interactive Choropleth Map (Single Map)
     st.subheader("Interactive District-Level Map")
     st.markdown("Color represents **Iceberg Index**. Hover for details.")
     
-    map_chart = create_choropleth(df, geojson)
+    map_chart = _choropleth(df, geojson, (data_version(df), geojson_version))
     if map_chart:
         st.plotly_chart(map_chart, use_container_width=True)
     else:
@@ -78,45 +150,13 @@ def render_map(df, geojson):
     tab1, tab2 = st.tabs(["Search by District", "State Aggregation"])
     
     with tab1:
-        st.subheader("Search District")
-        districts = sorted(df['District_Name'].unique())
-        selected_dist = st.selectbox("Select District", districts)
-        
-        if selected_dist:
-            row = df[df['District_Name'] == selected_dist].iloc[0]
-            st.write(f"**District:** {selected_dist}")
-            st.write(f"**State:** {row['State_Name']}")
-            st.metric("Iceberg Index", f"{row['iceberg_index']:.2f}")
+        _district_search(df)
                 
     with tab2:
         st.subheader("State-Level Aggregation")
         
-        # Comprehensive Aggregation
-        agg_cols = {
-            'iceberg_index': ['mean', 'std', 'min', 'max'],
-            'surface_index': ['mean', 'std', 'min', 'max'],
-            'surprise_index': ['mean', 'std', 'min', 'max'],
-            'District_Name': 'count'
-        }
-        
-        state_agg = df.groupby('State_Name').agg(agg_cols).reset_index()
-        
-        # Flatten MultiIndex Columns
-        state_agg.columns = [
-            'State/UT',
-            'Iceberg Mean', 'Iceberg SD', 'Iceberg Min', 'Iceberg Max',
-            'Surface Mean', 'Surface SD', 'Surface Min', 'Surface Max',
-            'Surprise Mean', 'Surprise SD', 'Surprise Min', 'Surprise Max',
-            'Districts (n)'
-        ]
-        
-        # Reorder columns to match Appendix style: State, n, Iceberg stats, Surface stats, Surprise stats
-        cols_order = ['State/UT', 'Districts (n)', 
-                      'Iceberg Mean', 'Iceberg SD', 'Iceberg Min', 'Iceberg Max',
-                      'Surface Mean', 'Surface SD', 'Surface Min', 'Surface Max',
-                      'Surprise Mean', 'Surprise SD', 'Surprise Min', 'Surprise Max']
-        
-        state_agg = state_agg[cols_order].sort_values('Iceberg Mean', ascending=False)
+        # df is the frame from load_data, so the file version it records keys the cache
+        state_agg = _state_aggregation(df, data_version(df))
         
         # Styling
         st.dataframe(
@@ -126,8 +166,28 @@ def render_map(df, geojson):
             hide_index=True
         )
 
+@st.fragment
+def _district_search(df):
+    """
+    District lookup for the map page. Runs as a fragment, so picking a
+    district reruns only this block instead of re-sending the map.
+    """
+    st.subheader("Search District")
+    districts = _district_options(df, data_version(df))
+    selected_dist = st.selectbox("Select District", districts)
+    
+    if selected_dist:
+        row = df[df['District_Name'] == selected_dist].iloc[0]
+        st.write(f"**District:** {selected_dist}")
+        st.write(f"**State:** {row['State_Name']}")
+        st.metric("Iceberg Index", f"{row['iceberg_index']:.2f}")
+
+@st.fragment
 def render_analysis(df):
-    """Render socio-economic analysis."""
+    """
+    Render socio-economic analysis. df must be the frame returned by load_data.
+    Runs as a fragment, so changing the state filter reruns only this page.
+    """
     st.header("📊 Socio Economic Analysis")
     
     # --- Filter ---
@@ -147,13 +207,16 @@ def render_analysis(df):
     # Common Hover Data
     hover_cols = ['District_Name', 'State_Name']
     
+    # Figures are cached per filter; plot_df is fully determined by these
+    states_key = tuple(sorted(selected_states))
+    version = data_version(df)
+    
     with col1:
         st.subheader("Urbanization")
         # Explicit labels for nice Title Case
         labels_urban = {'urban_pct': 'Urban Percentage (%)', 'iceberg_index': 'Iceberg Index', 'total_employment': 'Employment Size'}
         st.plotly_chart(
-            plot_scatter(plot_df, "urban_pct", "iceberg_index", "total_employment", "iceberg_index", 
-                         hover_cols, labels=labels_urban), 
+            _scatter(plot_df, "urban_pct", hover_cols, labels_urban, states_key, version), 
             use_container_width=True
         )
         st.markdown("**Trend:** Higher urbanization correlates with higher AI exposure.")
@@ -163,8 +226,7 @@ def render_analysis(df):
         if 'literacy_rate' in plot_df.columns and plot_df['literacy_rate'].notna().sum() > 0:
             labels_lit = {'literacy_rate': 'Literacy Rate (%)', 'iceberg_index': 'Iceberg Index', 'total_employment': 'Employment Size'}
             st.plotly_chart(
-                plot_scatter(plot_df, "literacy_rate", "iceberg_index", "total_employment", "iceberg_index",
-                             hover_cols, labels=labels_lit), 
+                _scatter(plot_df, "literacy_rate", hover_cols, labels_lit, states_key, version), 
                 use_container_width=True
             )
             st.markdown("**Trend:** Education levels show positive correlation with exposure.")
@@ -176,8 +238,7 @@ def render_analysis(df):
         if 'Households_with_Internet' in plot_df.columns:
              labels_net = {'Households_with_Internet': 'Internet Households (%)', 'iceberg_index': 'Iceberg Index', 'total_employment': 'Employment Size'}
              st.plotly_chart(
-                plot_scatter(plot_df, "Households_with_Internet", "iceberg_index", "total_employment", "iceberg_index",
-                             hover_cols, labels=labels_net), 
+                _scatter(plot_df, "Households_with_Internet", hover_cols, labels_net, states_key, version), 
                 use_container_width=True
              )
              st.markdown("**Trend:** Digital access strongly tracks with automability.")